@@ -38,25 +38,31 @@ except (ImportError, ModuleNotFoundError) as error:
 
 # Local program imports:
 from ttt_utils import vcheck, grid_this, utils
+from ttt_utils.minimax import OPTIMAL_MOVES, bit_indices, state_key
 from ttt_utils.constants import (
     AUTO_FAST,
+    AUTO_MARKS,
+    AUTO_MODES,
     AUTO_SLOW,
+    BOARD,
     COLOR,
-    CORNERS,
+    CORNERS_MASK,
     FONT,
-    MARKS1,
-    MARKS2,
-    META_POSITIONS,
+    FULL_BOARD,
+    LINES_THROUGH,
+    META_POSITIONS_BITS,
     MY_OS,
-    ORTHO_SIDES,
+    ORTHO_SIDES_BITS,
     P1_MARK,
     P2_MARK,
-    PARA_CORNERS,
+    PARA_CORNERS_BITS,
     PLAY_AFTER,
+    PLAYER_MODES,
     PLAYER1,
     PLAYER2,
     SIDES,
-    WINNING_COMBOS,
+    SIDES_MASK,
+    WIN_MASKS,
 )
 
 
@@ -67,32 +73,12 @@ class TicTacToeGUI(tk.Tk):
     Methods: auto_command, auto_flash_game, auto_setup, auto_start,
     auto_stop, play_rudiments, autoplay_center,
     autoplay_random, autoplay_tactics, autospeed_control,
-    autostart_who, check_winner, color_pc_mark, configure_widgets,
-    display_status, highlight_result, grid_widgets, human_turn,
-    mode_control, new_game, play_defense, pc_turn,
-    play_random, reset_game_and_score, setup_game_board, turn_number,
-    unbind_game_board, window_geometry, ready_player_one
+    autostart_who, build_status_window, check_winner, color_pc_mark,
+    configure_widgets, display_status, highlight_result, grid_widgets, human_turn,
+    mode_control, new_game, place_mark, play_center, play_defense, pc_move, pc_turn,
+    play_perfect, play_random, reset_game_and_score, setup_game_board, show_scores,
+    turn_number, unbind_game_board, window_geometry, ready_player_one
     """
-    # Using __slots__ for all Class attributes gives slight reduction of
-    #   memory usage and maybe improved performance.
-    __slots__ = (
-        'after_id', 'auto_marks',
-        'auto_start_stop_btn', 'auto_center_mode', 'auto_random_mode',
-        'auto_tactics_mode', 'auto_turns_header', 'auto_turns_lbl',
-        'auto_turns_remaining', 'autospeed_fast', 'autospeed_slow',
-        'autospeed_lbl', 'autospeed_selection',
-        'board_labels', 'choose_pc_pref', 'pc_pref',
-        'curr_pmode', 'curr_automode', 'mode_clicked',
-        'p1_points', 'p1_score', 'p2_points', 'p2_score',
-        'player1_header', 'player1_score_lbl',
-        'player2_header', 'player2_score_lbl',
-        'prev_game_num', 'prev_game_num_header', 'prev_game_num_lbl',
-        'pvp_mode', 'pvpc_mode', 'quit_button',
-        'status_calls', 'statuswin_geometry',
-        'score_header', 'separator', 'ties_header', 'ties_lbl',
-        'ties_num', 'titlebar_offset', 'who_autostarts_btn', 'whose_turn',
-        'whose_turn_lbl', 'winner_found',
-    )
 
     def __init__(self):
         super().__init__()
@@ -100,6 +86,13 @@ class TicTacToeGUI(tk.Tk):
         # Game stats widgets and variables.
         self.p1_points = 0
         self.p2_points = 0
+        # Points last set to the p1_score and p2_score IntVars.
+        self.p1_shown = 0
+        self.p2_shown = 0
+        # Plain int counts, shown through the prev_game_num and ties_num
+        #   IntVars, so that reads need not go through Tcl.
+        self.prev_games = 0
+        self.tie_games = 0
         self.p1_score = tk.IntVar()
         self.p2_score = tk.IntVar()
         self.prev_game_num_header = tk.Label()
@@ -125,6 +118,11 @@ class TicTacToeGUI(tk.Tk):
 
         # Play action widgets.
         self.board_labels = [tk.Label() for _ in range(9)]
+        self.board_marks = [' '] * 9  # Mirrors board_labels text.
+        # Bitboards of each player's played squares; bit i is board index i.
+        self.p1_bits = 0
+        self.p2_bits = 0
+        self.turns_played = 0
         self.mode_clicked = tk.StringVar()
         self.pvp_mode = tk.Radiobutton()
         self.pvpc_mode = tk.Radiobutton()
@@ -142,6 +140,8 @@ class TicTacToeGUI(tk.Tk):
         self.autospeed_slow = tk.Radiobutton()
 
         # Game Status window variables.
+        self.status_window = None  # Game Status Toplevel, built when first needed.
+        self.status_lbl = None
         self.statuswin_geometry = ''  # Current Game Status window position.
         self.status_calls = 0  # Used as flag to set titlebar_offset.
         self.titlebar_offset = 0  # Used to properly position Game Status window.
@@ -150,11 +150,35 @@ class TicTacToeGUI(tk.Tk):
         self.separator = ttk.Separator()
         self.after_id = None  # A handler for after() and after_cancel() calls.
         self.auto_marks = ''  # Used to dole out autoplay marks in proper register.
-        self.curr_automode = ''  # Used to display whose_turn.
+        self.auto_mark_idx = 0  # Index of the next auto_marks mark to play.
+        self.curr_automode = ''  # Used to display whose_turn; set in mode_control().
         self.curr_pmode = ''  # Used to evaluate mode state.
         self.winner_found = False  # Used for game flow control.
         self.quit_button = ttk.Button()
 
+        # PvPC preference play methods, in order of precedence, used in
+        #   pc_move(). Each play_*() method returns True when it plays.
+        self.pc_plays = {
+            'PC plays random': (self.play_random,),
+            'PC plays center': (self.play_center, self.play_rudiments),
+            'PC plays tactics': (self.play_rudiments,
+                                 self.play_defense,
+                                 self.play_corners),
+            'PC plays perfect': (self.play_perfect,),
+        }
+
+        # Autoplay play methods, in order of precedence, used in the
+        #   autoplay_*() methods; built once rather than on every turn.
+        self.auto_plays = {
+            'Autoplay center': (self.play_center,
+                                self.play_rudiments,
+                                self.play_random),
+            'Autoplay tactics': (self.play_rudiments,
+                                 self.play_defense,
+                                 self.play_corners,
+                                 self.play_random),
+        }
+
         self.grid_widgets()
         self.configure_widgets()
         self.setup_game_board()
@@ -171,24 +195,13 @@ class TicTacToeGUI(tk.Tk):
         _row = 2
         _col = 0
 
-        # Set platform-specific padding between board squares (board_labels).
-        if MY_OS == 'win':  # Windows
-            pad = 8
-            ipadx = 10
-            ipady = 6
-        elif MY_OS == 'lin':  # Linux
-            pad = 0
-            ipadx = 10
-            ipady = 6
-        else:  # macOS
-            pad = 6
-            ipadx = 0
-            ipady = 0
+        # Platform-specific padding between board squares (board_labels).
+        pad = BOARD['pad']
 
         for lbl in self.board_labels:
             lbl.grid(row=_row, column=_col,
                      padx=pad, pady=pad,
-                     ipadx=ipadx, ipady=ipady)
+                     ipadx=BOARD['ipadx'], ipady=BOARD['ipady'])
             _col += 1
             # Grid 3 labels in 3 columns, then move to next row and repeat.
             if _col > 2:
@@ -209,15 +222,24 @@ class TicTacToeGUI(tk.Tk):
 
     def configure_widgets(self) -> None:
         """Initial configurations of mainloop window widgets."""
-        ttk.Style().theme_use('alt')
+
+        # Colors read on every play, mouseover, and game end are bound once as
+        #   instance attributes to avoid repeated COLOR dict lookups.
+        self.sq_not_won_color = COLOR['sq_not_won']
+        self.sq_mouseover_color = COLOR['sq_mouseover']
+        self.sq_won_color = COLOR['sq_won']
+        self.mark_fg_color = COLOR['mark_fg']
+        self.tk_white_color = COLOR['tk_white']
+
+        # ttk.Buttons are used b/c tk.Buttons cannot be configured in macOS.
+        style = ttk.Style()
+        style.theme_use('alt')
         utils.keybindings(self, 'quit_keys')
         utils.keybindings(self, 'bind_board')
 
         self.prev_game_num.set(0)
         self.ties_num.set(0)
 
-        # ttk.Buttons are used b/c tk.Buttons cannot be configured in macOS.
-        style = ttk.Style()
         style.map('My.TButton',
                   foreground=[('pressed', COLOR['disabled_fg']),
                               ('active', COLOR['mark_fg']),
@@ -284,7 +306,8 @@ class TicTacToeGUI(tk.Tk):
                                    width=15,
                                    values=('PC plays random',
                                            'PC plays center',
-                                           'PC plays tactics'),
+                                           'PC plays tactics',
+                                           'PC plays perfect'),
                                    state=tk.DISABLED)
         self.option_add("*TCombobox*Font", FONT['condensed'])
         self.choose_pc_pref.bind('<<ComboboxSelected>>',
@@ -340,50 +363,59 @@ class TicTacToeGUI(tk.Tk):
                                 width=4,
                                 command=lambda: utils.quit_game(mainloop=self))
 
+        # Board square options that do not change between games are set
+        #   here, once; setup_game_board() resets only per-game options.
+        for lbl in self.board_labels:
+            lbl.config(width=2,  # number of characters
+                       font=FONT['mark'],
+                       borderwidth=BOARD['borderwidth'],
+                       highlightthickness=BOARD['highlightthickness'],
+                       )
+
     def setup_game_board(self) -> None:
         """
-        Configure and activate play action for the game board squares.
+        Reset and activate play action for the game board squares.
+        Square size, font, and borders are set once in configure_widgets().
 
         :return: None
         """
 
         # Functions to change square backgrounds with mouseover & leave.
-        def on_enter(label: tk) -> None:
-            if label['bg'] == COLOR['sq_not_won'] and label['text'] == ' ':
-                label['bg'] = COLOR['sq_mouseover']
+        #   Whether a square is played is read from board_marks, so no
+        #   label options need to be read back from Tk. While squares are
+        #   bound, their bg is only ever sq_not_won or sq_mouseover;
+        #   display_status() unbinds the board in the same callback that
+        #   highlights a result.
+        def on_enter(label: tk, idx: int) -> None:
+            if self.board_marks[idx] == ' ':
+                label['bg'] = self.sq_mouseover_color
             else:  # The square has already been played.
-                label['bg'] = COLOR['sq_not_won']
+                label['bg'] = self.sq_not_won_color
 
         def on_leave(label: tk):
-            if label['bg'] == COLOR['sq_mouseover']:
-                label['bg'] = COLOR['sq_not_won']
-            elif label['bg'] == COLOR['sq_not_won']:
-                label['bg'] = COLOR['sq_not_won']
-
-        # Reset game board squares to starting configurations.
-        if MY_OS == 'dar':
-            bd_w = 6
-            hilite_w = 0
-        else:  # is Linux or Windows.
-            bd_w = 2  # default
-            hilite_w = 5
+            label['bg'] = self.sq_not_won_color
+
+        # Reset game board squares to starting marks and colors.
+        self.board_marks = [' '] * 9
+        self.p1_bits = 0
+        self.p2_bits = 0
+        self.turns_played = 0
+
+        start_style = dict(text=' ',
+                           bg=self.sq_not_won_color,
+                           fg=self.mark_fg_color,
+                           )
+        bind_squares = self.mode_clicked.get() in PLAYER_MODES
 
         for i, lbl in enumerate(self.board_labels):
-            lbl.config(text=' ',
-                       width=2,  # number of characters
-                       bg=COLOR['sq_not_won'],
-                       fg=COLOR['mark_fg'],
-                       font=FONT['mark'],
-                       borderwidth=bd_w,
-                       highlightthickness=hilite_w,
-                       )
+            lbl.config(**start_style)
 
-            if self.mode_clicked.get() in 'pvp, pvpc':
+            if bind_squares:
                 lbl.bind('<Button-1>',
                          lambda event, lbl_idx=i:
                          self.human_turn(self.board_labels[lbl_idx])
                          )
-                lbl.bind('<Enter>', lambda event, l=lbl: on_enter(l))
+                lbl.bind('<Enter>', lambda event, l=lbl, l_idx=i: on_enter(l, l_idx))
                 lbl.bind('<Leave>', lambda event, l=lbl: on_leave(l))
 
     def unbind_game_board(self) -> None:
@@ -436,7 +468,7 @@ class TicTacToeGUI(tk.Tk):
 
         # If a game is in progress, ignore any mode selections & post msg.
         if self.turn_number() > 0 and not self.winner_found:
-            if mode_clicked in 'pvp, pvpc':
+            if mode_clicked in PLAYER_MODES:
                 self.disable('auto_modes', 'auto_controls')
 
                 if self.curr_pmode == 'pvp':
@@ -448,7 +480,7 @@ class TicTacToeGUI(tk.Tk):
                     self.pvp_mode.config(state=tk.DISABLED)
                     # Only allow changing pc prefs on Human (P1) turn;
                     #  this forces completion of a two-turn game cycle.
-                    if self.prev_game_num.get() % 2 == 0:
+                    if self.prev_games % 2 == 0:
                         self.choose_pc_pref.config(state='readonly')
                     self.pvp_mode.deselect()
 
@@ -465,7 +497,7 @@ class TicTacToeGUI(tk.Tk):
                 self.choose_pc_pref.config(state=tk.DISABLED)
                 self.player2_header.config(text=f'{PLAYER2}:')
 
-            if mode_clicked in 'pvp, pvpc':
+            if mode_clicked in PLAYER_MODES:
                 self.disable('auto_controls')
                 self.ready_player_one()
                 utils.keybindings(self, 'bind_board')
@@ -476,7 +508,7 @@ class TicTacToeGUI(tk.Tk):
                 self.autospeed_slow.config(state=tk.NORMAL)
                 self.whose_turn.set(mode_clicked)
                 self.curr_automode = mode_clicked
-                self.whose_turn_lbl.config(bg=COLOR['tk_white'])
+                self.whose_turn_lbl.config(bg=self.tk_white_color)
 
             self.reset_game_and_score()
 
@@ -509,34 +541,45 @@ class TicTacToeGUI(tk.Tk):
         :return: None
         """
 
+        played_idx = self.board_labels.index(played_lbl)
+
         def h_plays(mark: str, next_turn_msg: str) -> None:
-            played_lbl['text'] = mark
+            self.place_mark(played_idx, mark)
             self.whose_turn.set(next_turn_msg)
-            self.whose_turn_lbl.config(bg=COLOR['tk_white'])
+            self.whose_turn_lbl.config(bg=self.tk_white_color)
             if mark == P2_MARK:
-                played_lbl.config(fg=COLOR['tk_white'])
+                played_lbl.config(fg=self.tk_white_color)
 
         # At start, Previous game # = 0, then increments after a win/tie.
         #  At start of a new game, turn # = 0.
         #  On even PvPC games, pc will have already played 1st turn.
 
-        if played_lbl['text'] == ' ':
+        # Whose turn it is follows from the game and turn counts,
+        #   read once, before the play changes the turn count.
+        mode = self.mode_clicked.get()
+        p1_turn = self.prev_games % 2 == self.turn_number() % 2
+
+        # Clicks made while the PC's move is pending, on empty or taken
+        #   squares, are ignored; see pc_turn().
+        if mode == 'pvpc' and not p1_turn:
+            return
+
+        if self.board_marks[played_idx] == ' ':
             self.disable('auto_modes', 'auto_controls')
 
-            if self.mode_clicked.get() == 'pvp':
+            if mode == 'pvp':
                 self.curr_pmode = 'pvp'
-                if self.prev_game_num.get() % 2 == self.turn_number() % 2:
+                if p1_turn:
                     h_plays(P1_MARK, f'{PLAYER2} plays {P2_MARK}')
                 else:
                     h_plays(P2_MARK, f'{PLAYER1} plays {P1_MARK}')
 
                 if self.turn_number() >= 5:
-                    self.check_winner(played_lbl.cget('text'))
+                    self.check_winner(self.board_marks[played_idx])
 
             else:  # The PvPC mode was clicked.
                 self.curr_pmode = 'pvpc'
-                if self.prev_game_num.get() % 2 == self.turn_number() % 2:
-                    h_plays(P1_MARK, f'PC plays {P2_MARK}')
+                h_plays(P1_MARK, f'PC plays {P2_MARK}')
 
                 self.update_idletasks()
 
@@ -554,11 +597,33 @@ class TicTacToeGUI(tk.Tk):
                 self.pvp_mode.config(state=tk.DISABLED)
 
         else:  # The played_lbl has a player's mark as its text.
-            curr_player = PLAYER1 if PLAYER1 in self.whose_turn.get() else PLAYER2
-            curr_mark = P1_MARK if PLAYER1 in self.whose_turn.get() else P2_MARK
+            if PLAYER1 in self.whose_turn.get():
+                curr_player, curr_mark = PLAYER1, P1_MARK
+            else:
+                curr_player, curr_mark = PLAYER2, P2_MARK
             self.whose_turn.set(f'That square is\ntaken {curr_player}.\n'
                                 f'Play {curr_mark} elsewhere.')
 
+    def place_mark(self, idx: int, mark: str) -> None:
+        """
+        Play *mark* on a board square. All plays go through here so that
+        board_marks, the Python mirror of the board_labels text, and the
+        p1_bits and p2_bits bitboards, and the turns_played count stay in
+        register with the display.
+        The label text change is drawn by Tk at its next idle cycle.
+
+        :param idx: The board_labels index of the played square.
+        :param mark: The player's mark character, as string.
+        :return: None
+        """
+        self.board_marks[idx] = mark
+        if mark == P1_MARK:
+            self.p1_bits |= 1 << idx
+        else:
+            self.p2_bits |= 1 << idx
+        self.turns_played += 1
+        self.board_labels[idx]['text'] = mark
+
     def color_pc_mark(self, _id: int) -> None:
         """
         In PvPC mode, display alternate fg color for PC's mark text.
@@ -569,67 +634,56 @@ class TicTacToeGUI(tk.Tk):
         :return: None
         """
 
-        self.board_labels[_id].config(fg=COLOR['tk_white'])
+        self.board_labels[_id].config(fg=self.tk_white_color)
 
     def pc_turn(self) -> None:
         """
-        Conditions for PC to play as Player2 (P2_MARK).
-        Precedence of PC play: selected pref option > play for a win >
-        block P1 win > play to corner, if preferred > play random.
+        Start the PC's turn as Player2 (P2_MARK) in PvPC mode.
         Called from human_turn() and new_game().
-        Color PC mark as 'tk_white', which is the system's 'white'.
 
         :return: None
         """
-        # Inspiration for basic play-action algorithm:
-        # https://www.simplifiedpython.net/python-tic-tac-toe-using-artificial-intelligence/
-
         turn_number = self.turn_number()
 
         # Delay play for a better feel, but not when PC starts a game b/c
         #   that just delays closing the Game Status toplevel for a new game.
+        # The delay is scheduled, not slept, so the app window stays
+        #   responsive; human_turn() ignores board clicks until PC plays.
         if turn_number > 0:
-            self.after(PLAY_AFTER)
             self.choose_pc_pref.config(state=tk.DISABLED)
+            self.after(PLAY_AFTER, lambda: self.pc_move(turn_number))
+        else:
+            self.pc_move(turn_number)
 
-        # Need to re-order winner list so Human doesn't detect a pattern
-        #   of where PC will play.
-        #   CORNERS list is shuffled in play_corners().
-        random.shuffle(WINNING_COMBOS)
-
-        """Turn number will advance following PC play from any of the
-        play_xxx() methods used here in succession. If no play is made,
-        turn_number will not advance, so the next play_xxx() method will
-        be called."""
-
-        # Preference: all PC moves are random.
-        if self.choose_pc_pref.get() == 'PC plays random':
-            self.play_random(turn_number, P2_MARK)
-
-        # Preference: play the center when it is available.
-        elif self.choose_pc_pref.get() == 'PC plays center':
-            if self.board_labels[4]['text'] == ' ':
-                self.board_labels[4]['text'] = P2_MARK
-                self.color_pc_mark(4)
-
-        # Now prefer to play for win, then for block.
-        if turn_number == self.turn_number():
-            self.play_rudiments(P2_MARK, pvpc=True)
-
-        # Tactical preference: play a set of rules to minimize losses.
-        if self.choose_pc_pref.get() == 'PC plays tactics':
-            if turn_number == self.turn_number():
-                self.play_defense(turn_number, P2_MARK, pvpc=True)
+    def pc_move(self, turn_number: int) -> None:
+        """
+        Conditions for PC to play as Player2 (P2_MARK).
+        Precedence of PC play: selected pref option > play for a win >
+        block P1 win > play to corner, if preferred > play random.
+        Play methods for each pref option are dispatched from pc_plays.
+        Called from pc_turn().
+        Color PC mark as 'tk_white', which is the system's 'white'.
 
-            # Fill in available corners to play for advantage.
-            if turn_number == self.turn_number():
-                self.play_corners(turn_number, P2_MARK, pvpc=True)
+        :param turn_number: Current turn count from turn_number().
+        :return: None
+        """
+        # Inspiration for basic play-action algorithm:
+        # https://www.simplifiedpython.net/python-tic-tac-toe-using-artificial-intelligence/
 
-        # No preferred plays are available, so play random.
-        if turn_number == self.turn_number():
-            self.play_random(turn_number, P2_MARK)
+        # The selected pref's play_*() methods are tried in succession
+        #   until one of them plays; random play is the fallback.
+        #   Random pref: all PC moves are random.
+        #   Center pref: play the open center, then play for win or block.
+        #   Tactics pref: play for win or block, then a set of rules to
+        #   minimize losses, then corners to play for advantage.
+        for play in self.pc_plays[self.choose_pc_pref.get()]:
+            if play(turn_number, P2_MARK, pvpc=True):
+                break
+        else:
+            # No preferred plays are available, so play random.
+            self.play_random(turn_number, P2_MARK, pvpc=True)
             print('PC played randomly (nothing to block or win), '
-                  f'Game {self.prev_game_num.get() + 1}:Turn {turn_number + 1}')
+                  f'Game {self.prev_games + 1}:Turn {turn_number + 1}')
 
         if self.turn_number() >= 5:
             self.check_winner(P2_MARK)
@@ -639,53 +693,70 @@ class TicTacToeGUI(tk.Tk):
 
         self.update_idletasks()
 
-    def play_rudiments(self, mark: str, pvpc=False) -> None:
+    def play_center(self, turn_number: int, mark: str, pvpc=False) -> bool:
+        """
+        Play the center square when it is available.
+
+        :param turn_number: Current turn count from turn_number(); not
+                            used, but keeps the play_*() call signature.
+        :param mark: The played mark string character.
+        :param pvpc: Use when called from a P v PC mode (default, False).
+        :return: True if the center was played, False if not.
+        """
+        if self.board_marks[4] == ' ':
+            self.place_mark(4, mark)
+            if pvpc:
+                self.color_pc_mark(4)
+            return True
+        return False
+
+    def play_rudiments(self, turn_number: int, mark: str, pvpc=False) -> bool:
         """
         The rules engine for basic play to win or block.
 
+        :param turn_number: Current turn count from turn_number().
         :param mark: The played mark string character.
         :param pvpc: Use when called from a P v PC mode (default, False).
-        :returns: None
+        :return: True if a win or block was played, False if not.
         """
 
-        # Randomize the order of the WINNING_COMBOS list so Human
-        #  can't detect a pattern of PC play.
-        random.shuffle(WINNING_COMBOS)
-        opponent = P2_MARK if mark == P1_MARK else P1_MARK
+        # Neither player has two marks to win with or block
+        #  until three turns have been played.
+        if turn_number < 3:
+            return False
+
+        if mark == P1_MARK:
+            own_bits, oppo_bits = self.p1_bits, self.p2_bits
+        else:
+            own_bits, oppo_bits = self.p2_bits, self.p1_bits
+
+        empties = bit_indices(FULL_BOARD & ~(own_bits | oppo_bits))
 
         # Note that running two loops is necessary to prioritize
         #  winning over blocking because need to first evaluate ALL
         #  possible winning moves before trying to block.
-        # Use the count method to check if there are two marks in the
-        #  positions and the index method to find an empty position.
+        # An empty square completes a line when both other squares of
+        #  any line through it, from LINES_THROUGH, are held by one player.
 
         # First, play to win; check positions of current player's marks.
         #  If two player's marks are aligned, fill the empty third position.
-        for combo in WINNING_COMBOS:
-            _x, _y, _z = combo
-            positions = [self.board_labels[pos]['text'] for pos in combo]
-            empty_index = positions.index(' ') if ' ' in positions else None
-
-            if positions.count(mark) == 2 and empty_index is not None:
-                self.board_labels[combo[empty_index]]['text'] = mark
-                if pvpc:
-                    self.color_pc_mark(combo[empty_index])
-                return
-
         # No win available, so play to block; check positions of opponent's marks.
         #  If two opponent's marks are aligned, play the empty third position.
-        for combo in WINNING_COMBOS:
-            _x, _y, _z = combo
-            positions = [self.board_labels[pos]['text'] for pos in combo]
-            empty_index = positions.index(' ') if ' ' in positions else None
-
-            if positions.count(opponent) == 2 and empty_index is not None:
-                self.board_labels[combo[empty_index]]['text'] = mark
+        # When more than one square qualifies, pick one at random so Human
+        #  can't detect a pattern of PC play.
+        for bits in (own_bits, oppo_bits):
+            squares = [idx for idx in empties
+                       if any((bits & pair) == pair for pair in LINES_THROUGH[idx])]
+            if squares:
+                idx = random.choice(squares)
+                self.place_mark(idx, mark)
                 if pvpc:
-                    self.color_pc_mark(combo[empty_index])
-                break
+                    self.color_pc_mark(idx)
+                return True
 
-    def play_defense(self, turn_number: int, mark: str, pvpc=False) -> None:
+        return False
+
+    def play_defense(self, turn_number: int, mark: str, pvpc=False) -> bool:
         """
         A rules-based set of defensive responses to minimize PC losses.
         Strategy in decreasing priority: defend center, sides, corners.
@@ -694,66 +765,71 @@ class TicTacToeGUI(tk.Tk):
         :param mark: The played mark character, as string.
         :param pvpc: Use when called from a P v PC mode (default, False).
 
-        :return: None
+        :return: True if a defensive play was made, False if not.
         """
 
-        # Get opponent's mark and list indices of its played squares.
-        oppo_mark = P2_MARK if mark == P1_MARK else P1_MARK
-        oppo_list = [i for i in range(9) if self.board_labels[i]['text'] == oppo_mark]
+        # Get bitboards of opponent's squares and of empty squares.
+        #   Defensive positions match when the opponent holds exactly
+        #   the squares of a *_BITS table entry.
+        oppo_bits = self.p2_bits if mark == P1_MARK else self.p1_bits
+        empty_bits = FULL_BOARD & ~(self.p1_bits | self.p2_bits)
 
         # Always defend center, if available, in response to opponent's 1st turn.
         if turn_number == 1:
-            if self.board_labels[4]['text'] == ' ':
-                self.board_labels[4]['text'] = mark
+            if empty_bits & (1 << 4):
+                self.place_mark(4, mark)
                 if pvpc:
                     self.color_pc_mark(4)
                     print('PC grabbed the center, '
-                          f'Game {self.prev_game_num.get() + 1}:Turn {turn_number + 1}')
+                          f'Game {self.prev_games + 1}:Turn {turn_number + 1}')
+                return True
         elif turn_number > 1:
             # When opponent plays a side square, play the open center to
             #  reduce possibility of a loss.
-            if (self.board_labels[4]['text'] == ' ' and
-                    oppo_mark in (self.board_labels[i]['text'] for i in SIDES)):
-                self.board_labels[4]['text'] = mark
+            if empty_bits & (1 << 4) and oppo_bits & SIDES_MASK:
+                self.place_mark(4, mark)
                 if pvpc:
                     self.color_pc_mark(4)
                     print('PC played center defense, '
-                          f'Game {self.prev_game_num.get() + 1}:Turn {turn_number + 1}')
-                    return
+                          f'Game {self.prev_games + 1}:Turn {turn_number + 1}')
+                return True
 
             # When opponent is on two adjacent side squares, defend with play
             #   to the shared (nearest) corner.
-            for key, val in ORTHO_SIDES.items():
-                if self.board_labels[key]['text'] == ' ' and oppo_list == val:
-                    self.board_labels[key]['text'] = mark
-                    if pvpc:
-                        self.color_pc_mark(key)
-                        print('PC played corner for orthogonal sides defense, '
-                              f'Game {self.prev_game_num.get() + 1}:Turn {turn_number + 1}')
-                    return
+            key = ORTHO_SIDES_BITS.get(oppo_bits)
+            if key is not None and empty_bits & (1 << key):
+                self.place_mark(key, mark)
+                if pvpc:
+                    self.color_pc_mark(key)
+                    print('PC played corner for orthogonal sides defense, '
+                          f'Game {self.prev_games + 1}:Turn {turn_number + 1}')
+                return True
 
             # When opponent has played a corner and a non-adjacent side, defend with
             #   play to opponent's shared (nearest) corner.
-            for key, val in META_POSITIONS.items():
-                if self.board_labels[key]['text'] == ' ' and oppo_list == val:
-                    self.board_labels[key]['text'] = mark
-                    if pvpc:
-                        self.color_pc_mark(key)
-                        print('PC played corner for meta-positional defense, '
-                              f'Game {self.prev_game_num.get() + 1}:Turn {turn_number + 1}')
-                    return
+            key = META_POSITIONS_BITS.get(oppo_bits)
+            if key is not None and empty_bits & (1 << key):
+                self.place_mark(key, mark)
+                if pvpc:
+                    self.color_pc_mark(key)
+                    print('PC played corner for meta-positional defense, '
+                          f'Game {self.prev_games + 1}:Turn {turn_number + 1}')
+                return True
 
             # When opponent has played to opposite corners, defend with play to
             #   a random side.
             side2play = random.choice(SIDES)
-            if oppo_list in PARA_CORNERS:
-                self.board_labels[side2play]['text'] = mark
+            if oppo_bits in PARA_CORNERS_BITS and empty_bits & (1 << side2play):
+                self.place_mark(side2play, mark)
                 if pvpc:
                     self.color_pc_mark(side2play)
                     print('PC played a side for para-corners defense,'
-                          f' Game {self.prev_game_num.get() + 1}:Turn {turn_number + 1}')
+                          f' Game {self.prev_games + 1}:Turn {turn_number + 1}')
+                return True
+
+        return False
 
-    def play_corners(self, turn_number: int, mark: str, pvpc=False) -> None:
+    def play_corners(self, turn_number: int, mark: str, pvpc=False) -> bool:
         """
         Fill in available corners to increase probability of a win.
         Used for 'tactics' play modes.
@@ -762,39 +838,73 @@ class TicTacToeGUI(tk.Tk):
         :param mark: The played mark character, as string.
         :param pvpc: True when called from a P vs PC mode (default, False).
 
-        :return: None
+        :return: True if a corner was played, False if not.
         """
 
-        available_corners = [i for i in CORNERS if self.board_labels[i]['text'] == ' ']
-        if available_corners and turn_number == self.turn_number():
+        available_corners = bit_indices(CORNERS_MASK & ~(self.p1_bits | self.p2_bits))
+        if available_corners:
             i = random.choice(available_corners)
-            self.board_labels[i]['text'] = mark
+            self.place_mark(i, mark)
             if pvpc:
                 self.color_pc_mark(i)
-                print(f'PC played corner tactics, Game {self.prev_game_num.get() + 1}:Turn {turn_number + 1}')
+                print(f'PC played corner tactics, Game {self.prev_games + 1}:Turn {turn_number + 1}')
+            return True
+        return False
+
+    def play_perfect(self, turn_number: int, mark: str, pvpc=False) -> bool:
+        """
+        Play a best move from the precomputed minimax solution.
+        Among equally good moves, one is chosen at random so Human
+        can't detect a pattern of PC play.
+
+        :param turn_number: Current turn count from turn_number(); not
+                            used, but keeps the play_*() call signature.
+        :param mark: The player's mark string to play.
+        :param pvpc: True when called from a P vs PC mode (default, False).
 
-    def play_random(self, turn_number: int, mark: str) -> None:
+        :return: True if a position was played, False if not.
+        """
+        if mark == P1_MARK:
+            best_moves = OPTIMAL_MOVES.get(state_key(self.p1_bits, self.p2_bits))
+        else:
+            best_moves = OPTIMAL_MOVES.get(state_key(self.p2_bits, self.p1_bits))
+        if best_moves:
+            idx = random.choice(best_moves)
+            self.place_mark(idx, mark)
+            if pvpc:
+                self.color_pc_mark(idx)
+            return True
+        return False
+
+    def play_random(self, turn_number: int, mark: str, pvpc=False) -> bool:
         """ Play a random position in board_labels.
+        Samples directly from the empty squares, so one random draw
+        always finds an open position.
 
-        :param turn_number: Current turn count from turn_number().
+        :param turn_number: Current turn count from turn_number(); not
+                            used, but keeps the play_*() call signature.
         :param mark: The player's mark string to play.
+        :param pvpc: True when called from a P vs PC mode (default, False).
 
-        :return: None
+        :return: True if a random position was played, False if not.
         """
-        available_positions = [i for i in range(9) if self.board_labels[i]['text'] == ' ']
-        if available_positions and turn_number == self.turn_number():
+        available_positions = bit_indices(FULL_BOARD & ~(self.p1_bits | self.p2_bits))
+        if available_positions:
             random_idx = random.choice(available_positions)
-            self.board_labels[random_idx]['text'] = mark
-            if self.mode_clicked.get() in 'pvp, pvpc':
+            self.place_mark(random_idx, mark)
+            if pvpc:
                 self.color_pc_mark(random_idx)
+            return True
+        return False
+
     def turn_number(self) -> int:
         """
         Keep count of turns taken during a game.
-        Count number of board_labels squares with text other than a space.
+        The count is kept by place_mark() and reset by setup_game_board().
 
         :return: The number of turns played, as integer.
         """
-        return len([i for i in self.board_labels if ' ' not in i['text']])
+        return self.turns_played
 
     def check_winner(self, mark: str) -> None:
         """Check played board_labels for a win or tie.
@@ -804,6 +914,7 @@ class TicTacToeGUI(tk.Tk):
         """
 
         mode = self.mode_clicked.get()
+        pc_pref = self.pc_pref.get()
 
         def award_points(winning_mark: str) -> None:
             """
@@ -822,27 +933,29 @@ class TicTacToeGUI(tk.Tk):
             self.p1_points += winning_mark == P1_MARK
             self.p2_points += winning_mark != P1_MARK
 
-        # Loop breaks when the first winning combo is found.
-        for combo in WINNING_COMBOS:
-            lbl_texts = [self.board_labels[i]['text'] for i in combo]
-
-            if all(text == mark for text in lbl_texts):
+        # Test the *mark* player's bitboard against each winning mask.
+        #   Loop breaks when the first winning combo is found.
+        bits = self.p1_bits if mark == P1_MARK else self.p2_bits
+        for mask in WIN_MASKS:
+            if (bits & mask) == mask:
+                combo = bit_indices(mask)
                 self.winner_found = True
-                self.prev_game_num.set(self.prev_game_num.get() + 1)
-                game = self.prev_game_num.get()
+                self.prev_games += 1
+                self.prev_game_num.set(self.prev_games)
+                game = self.prev_games
                 turn = self.turn_number()
 
                 award_points(mark)
-                if 'Autoplay' in mode:
+                if mode in AUTO_MODES:
                     self.auto_flash_game(combo, mark)
                 elif mode == 'pvpc':
                     self.highlight_result('win', combo)
                     display_message = 'PC WINS!' if mark == P2_MARK else 'You WIN!'
                     self.display_status(display_message)
-                    if self.pc_pref.get() in ['PC plays tactics', 'PC plays center']:
+                    if pc_pref in ('PC plays tactics', 'PC plays center'):
                         winner = 'PC' if mark == P2_MARK else 'Human'
                         print(
-                            f'{winner} won "{self.pc_pref.get()} mode", Game {game}:Turn {turn}.')
+                            f'{winner} won "{pc_pref} mode", Game {game}:Turn {turn}.')
                 else:
                     self.highlight_result('win', combo)
                     self.display_status(f'{mark} WINS!')
@@ -850,7 +963,8 @@ class TicTacToeGUI(tk.Tk):
 
         if self.turn_number() == 9 and not self.winner_found:  # Is a tie.
             self.winner_found = True
-            self.prev_game_num.set(self.prev_game_num.get() + 1)
+            self.prev_games += 1
+            self.prev_game_num.set(self.prev_games)
 
             # Record to file all tied board_labels lists.
             # tielist = f'{[i["text"] for i in self.board_labels]}\n'
@@ -860,43 +974,40 @@ class TicTacToeGUI(tk.Tk):
             self.p1_points += 0.5
             self.p2_points += 0.5
 
-            self.ties_num.set(self.ties_num.get() + 1)
+            self.tie_games += 1
+            self.ties_num.set(self.tie_games)
 
-            if 'Autoplay' in mode:
+            if mode in AUTO_MODES:
                 self.auto_flash_game((4, 4, 4), 'TIE')
             else:  # Mode selection is pvp or pvpc.
                 self.highlight_result('tie')
                 self.display_status('IT IS A TIE!')
                 self.whose_turn.set('Game pending...')
-                self.whose_turn_lbl.config(bg=COLOR['tk_white'])
+                self.whose_turn_lbl.config(bg=self.tk_white_color)
 
                 # Print is not needed here for 'PC plays random'.
-                if self.pc_pref.get() in 'PC plays tactics, PC plays center':
+                if pc_pref in ('PC plays tactics', 'PC plays center'):
                     print('-Tie-')
 
     def highlight_result(self, status: str, combo=None) -> None:
         """
         Change color of board squares depending on game result.
+        All squares are recolored in one pass so that Tk redraws them
+        in a single idle cycle.
 
-        Derived from Bryan Oakley's answer for
-        how-to-make-a-button-flash-using-after-in-tkinter
-        https://stackoverflow.com/a/57298778
         :param status: End game result, either 'win' or 'tie'.
         :param combo: Tuple of the three winning board_labels indices,
                       or None (default) for a tie.
         :return: None
         """
         if status == 'win':
-            _x, _y, _z = combo
-
-            self.after(10, lambda: self.board_labels[_x].config(bg=COLOR['sq_won']))
-            self.after(175, lambda: self.board_labels[_y].config(bg=COLOR['sq_won']))
-            self.after(345, lambda: self.board_labels[_z].config(bg=COLOR['sq_won']))
-
+            squares = [self.board_labels[idx] for idx in combo]
         else:  # status is 'tie'
-            for lbl in self.board_labels:
-                lbl.config(bg=COLOR['sq_won'])
-                self.update_idletasks()
+            squares = self.board_labels
+
+        for lbl in squares:
+            lbl.config(bg=self.sq_won_color)
+        self.update_idletasks()
 
     def window_geometry(self, toplevel: tk) -> None:
         """
@@ -945,13 +1056,34 @@ class TicTacToeGUI(tk.Tk):
         self.disable('player_modes', 'auto_modes', 'auto_controls')
 
         self.whose_turn.set('Game pending...')
-        self.whose_turn_lbl.config(bg=COLOR['tk_white'])
+        self.whose_turn_lbl.config(bg=self.tk_white_color)
 
         # Need to update players' cumulative wins in the app window.
-        self.p1_score.set(self.p1_points)
-        self.p2_score.set(self.p2_points)
+        self.show_scores()
+
+        # The status window and its widgets are built on the first call,
+        #   then withdrawn between games and shown again with a new message.
+        if self.status_window is None:
+            self.build_status_window()
+
+        self.status_lbl.config(text=status_msg)
+
+        self.status_calls += 1
+        self.window_geometry(self.status_window)
+        self.status_window.deiconify()
+
+        # Need to prevent focus shifting to app window which would cover
+        #  the Report window.
+        self.status_window.attributes('-topmost', True)
+        self.status_window.focus_force()
 
-        # Now set up the status window and its actions:
+    def build_status_window(self) -> None:
+        """
+        Create the Game Status window, its message label and its
+        action Buttons. Called once, from the first display_status().
+
+        :return: None
+        """
         status_window = tk.Toplevel(self,
                                     bg=COLOR['status_bg'],
                                     borderwidth=4,
@@ -966,18 +1098,9 @@ class TicTacToeGUI(tk.Tk):
         status_window.geometry(size)
         status_window.minsize(min_w, min_h)
 
-        self.status_calls += 1
-        self.window_geometry(status_window)
-
-        # Need to prevent focus shifting to app window which would cover
-        #  the Report window.
-        status_window.attributes('-topmost', True)
-        status_window.focus_force()
-
-        status_lbl = tk.Label(status_window,
-                              text=status_msg,
-                              font=FONT['status'],
-                              bg=COLOR['status_bg'])
+        self.status_lbl = tk.Label(status_window,
+                                   font=FONT['status'],
+                                   bg=COLOR['status_bg'])
 
         def no_exit_on_x():
             messagebox.showinfo(
@@ -991,7 +1114,7 @@ class TicTacToeGUI(tk.Tk):
         def restart_game():
             """
             Record current xy geometry of Report window, then reset game
-            board and close window.
+            board and hide window.
             Called from keybind and Button cmd.
 
             :return: None
@@ -1004,7 +1127,7 @@ class TicTacToeGUI(tk.Tk):
                 f'+{status_window.winfo_y() - self.titlebar_offset}'
             )
             self.new_game()
-            status_window.destroy()
+            status_window.withdraw()
 
         again = tk.Button(status_window, text='New Game (\u23CE)',
                           # Unicode Return/Enter key symbol ^^^.
@@ -1022,16 +1145,18 @@ class TicTacToeGUI(tk.Tk):
         status_window.bind('<Return>', lambda _: restart_game())
         status_window.bind('<KP_Enter>', lambda _: restart_game())
 
-        status_lbl.pack(pady=3, padx=3)
+        self.status_lbl.pack(pady=3, padx=3)
         again.pack(pady=(0, 0))
         not_again.pack(pady=5)
 
+        self.status_window = status_window
+
     def new_game(self) -> None:
         """
         Set configurations for a new game.
 
         Called from display_status.restart_game().
-        Calls to setup_game_board(); conditionally to ready_player_one(),
+        Conditionally calls to setup_game_board(), ready_player_one(),
         utils.keybindings(), pc_turn(), reset_game_and_score().
         return: None
         """
@@ -1053,24 +1178,27 @@ class TicTacToeGUI(tk.Tk):
         self.auto_turns_lbl.config(fg=COLOR['tk_white'])
 
         self.winner_found = False
-        self.setup_game_board()
+
+        # In Autoplay modes, reset_game_and_score() sets up the board.
+        if mode not in AUTO_MODES:
+            self.setup_game_board()
 
         if mode == 'pvp':
             utils.keybindings(self, 'bind_board')
             self.choose_pc_pref.config(state=tk.DISABLED)
 
-            if self.prev_game_num.get() % 2 == 0:
+            if self.prev_games % 2 == 0:
                 self.ready_player_one()
             else:
                 self.whose_turn.set(f'{PLAYER2} plays {P2_MARK}')
-                self.whose_turn_lbl.config(bg=COLOR['tk_white'])
+                self.whose_turn_lbl.config(bg=self.tk_white_color)
 
         elif mode == 'pvpc':
             utils.keybindings(self, 'bind_board')
 
-            if self.prev_game_num.get() % 2 != 0:
+            if self.prev_games % 2 != 0:
                 self.whose_turn.set(f'PC plays {P2_MARK}')
-                self.whose_turn_lbl.config(bg=COLOR['tk_white'])
+                self.whose_turn_lbl.config(bg=self.tk_white_color)
                 self.disable('auto_modes', 'auto_controls')
                 self.pc_turn()
             else:
@@ -1079,15 +1207,32 @@ class TicTacToeGUI(tk.Tk):
 
         # At restart of an autoplay series or when stopped by user,
         #   need to clear auto scores and games.
-        elif 'Autoplay' in mode:
+        elif mode in AUTO_MODES:
             self.reset_game_and_score()
             self.auto_turns_remaining.set(0)
             self.auto_marks = ''
+            self.auto_mark_idx = 0
             self.auto_start_stop_btn.config(text='Start Autoplay',
                                             state=tk.NORMAL)
             self.who_autostarts_btn.configure(state=tk.NORMAL)
             self.choose_pc_pref.config(state=tk.DISABLED)
 
+    def show_scores(self) -> None:
+        """
+        Update the players' score labels with their cumulative points.
+        A score is set only when it has changed since it was last shown,
+        which saves the Tcl variable writes and label redraws for the
+        player who did not score.
+
+        :return: None
+        """
+        if self.p1_points != self.p1_shown:
+            self.p1_score.set(self.p1_points)
+            self.p1_shown = self.p1_points
+        if self.p2_points != self.p2_shown:
+            self.p2_score.set(self.p2_points)
+            self.p2_shown = self.p2_points
+
     def reset_game_and_score(self) -> None:
         """
         Set game number and player points to zero.
@@ -1098,18 +1243,19 @@ class TicTacToeGUI(tk.Tk):
 
         :return: None
         """
+        self.prev_games = 0
+        self.tie_games = 0
         self.prev_game_num.set(0)
-        self.p1_score.set(0)
-        self.p2_score.set(0)
         self.p1_points = 0
         self.p2_points = 0
+        self.show_scores()
         self.ties_num.set(0)
         self.setup_game_board()
 
-        if 'Autoplay' in self.mode_clicked.get():
+        if self.mode_clicked.get() in AUTO_MODES:
             self.unbind_game_board()
             self.whose_turn.set(self.curr_automode)
-            self.whose_turn_lbl.config(bg=COLOR['tk_white'])
+            self.whose_turn_lbl.config(bg=self.tk_white_color)
 
     def auto_command(self) -> None:
         """
@@ -1121,7 +1267,7 @@ class TicTacToeGUI(tk.Tk):
         """
         if self.auto_start_stop_btn['text'] == 'Start Autoplay':
 
-            if 'Autoplay' in self.mode_clicked.get():
+            if self.mode_clicked.get() in AUTO_MODES:
                 self.auto_start_stop_btn['text'] = 'Stop Autoplay'
                 self.auto_start()
             else:
@@ -1138,10 +1284,12 @@ class TicTacToeGUI(tk.Tk):
         Disable modes during autoplay.
         :return: None
         """
-        self.auto_setup()
+        # reset_game_and_score() zeros the scores and sets up the board,
+        #   so auto_setup() is not needed until the next game.
+        self.winner_found = False
         self.reset_game_and_score()
         self.whose_turn.set(self.curr_automode)
-        self.whose_turn_lbl.config(bg=COLOR['tk_white'])
+        self.whose_turn_lbl.config(bg=self.tk_white_color)
 
         # Change font from invisible (bg color) to default color to view.
         self.auto_turns_header.config(fg='black')
@@ -1151,10 +1299,10 @@ class TicTacToeGUI(tk.Tk):
         self.who_autostarts_btn.config(state=tk.DISABLED)
 
         # Provide alternating pc player marks in autoplay turns;
-        #   The marks string is shortened one character per turn in the
-        #   autoplay_* methods, and in auto_setup() depending on the
-        #   who_autostarts_btn option.
-        self.auto_marks = ''.join(map(lambda m1, m2: m1 + m2, MARKS1, MARKS2))
+        #   auto_mark_idx advances one mark per turn in auto_repeat(),
+        #   and in auto_setup() depending on the who_autostarts_btn option.
+        self.auto_marks = AUTO_MARKS
+        self.auto_mark_idx = 0
 
         # Start repeating calls to one of the autoplay methods;
         #   calls are controlled by after_id.
@@ -1192,23 +1340,22 @@ class TicTacToeGUI(tk.Tk):
         At start of new autoplay games, update scores in the main window.
 
         Clear all marks from the board.
-        Called from auto_start() and auto_flash_game().
+        Called from auto_flash_game().
 
         :return: None
         """
-        self.p1_score.set(self.p1_points)
-        self.p2_score.set(self.p2_points)
+        self.show_scores()
 
-        if len(self.auto_marks) > 0:
+        # Skip the next mark when it is not the starting player's mark.
+        if self.auto_mark_idx < len(self.auto_marks):
             if self.who_autostarts_btn['text'] == 'Player 1 starts':
                 # All games start with P1_MARK.
-                self.auto_marks = self.auto_marks.lstrip(P2_MARK)
+                skip_mark = P2_MARK
             else:
                 # Games alternate starts between P1_MARK and P2_MARK.
-                if self.prev_game_num.get() % 2 == 0:
-                    self.auto_marks = self.auto_marks.lstrip(P2_MARK)
-                else:
-                    self.auto_marks = self.auto_marks.lstrip(P1_MARK)
+                skip_mark = P2_MARK if self.prev_games % 2 == 0 else P1_MARK
+            if self.auto_marks[self.auto_mark_idx] == skip_mark:
+                self.auto_mark_idx += 1
 
         self.winner_found = False
         self.setup_game_board()
@@ -1267,12 +1414,11 @@ class TicTacToeGUI(tk.Tk):
 
         :return: None
         """
-        self.curr_automode = 'Autoplay random'
-        self.auto_turns_remaining.set(len(self.auto_marks))
+        self.auto_turns_remaining.set(len(self.auto_marks) - self.auto_mark_idx)
         turn_number = self.turn_number()
 
-        if len(self.auto_marks) > 0:
-            mark = self.auto_marks[0]
+        if self.auto_mark_idx < len(self.auto_marks):
+            mark = self.auto_marks[self.auto_mark_idx]
             self.play_random(turn_number, mark)
             self.auto_repeat(mark, self.autoplay_random)
         else:
@@ -1293,25 +1439,18 @@ class TicTacToeGUI(tk.Tk):
 
         :return: None
         """
-        self.curr_automode = 'Autoplay center'
-
-        self.auto_turns_remaining.set(len(self.auto_marks))
+        self.auto_turns_remaining.set(len(self.auto_marks) - self.auto_mark_idx)
         turn_number = self.turn_number()
 
-        if len(self.auto_marks) > 0:
-            mark = self.auto_marks[0]
-
-            # Fill in the available center.
-            if self.board_labels[4]['text'] == ' ':
-                self.board_labels[4]['text'] = mark
+        if self.auto_mark_idx < len(self.auto_marks):
+            mark = self.auto_marks[self.auto_mark_idx]
 
-            # Look for a winning or blocking play.
-            if turn_number == self.turn_number():
-                self.play_rudiments(mark)
-
-            # No preferred play available, so play random.
-            if turn_number == self.turn_number():
-                self.play_random(turn_number, mark)
+            # Fill in the available center, else look for a winning or
+            #   blocking play. No preferred play available, so play random.
+            #   Each play_*() returns True once it has played the turn.
+            for play in self.auto_plays['Autoplay center']:
+                if play(turn_number, mark):
+                    break
 
             self.auto_repeat(mark, self.autoplay_center)
 
@@ -1333,32 +1472,23 @@ class TicTacToeGUI(tk.Tk):
 
         :return: None
         """
-        self.curr_automode = 'Autoplay tactics'
-
-        self.auto_turns_remaining.set(len(self.auto_marks))
+        self.auto_turns_remaining.set(len(self.auto_marks) - self.auto_mark_idx)
         turn_number = self.turn_number()
 
-        if len(self.auto_marks) > 0:
-            mark = self.auto_marks[0]
+        if self.auto_mark_idx < len(self.auto_marks):
+            mark = self.auto_marks[self.auto_mark_idx]
 
             # Need to randomize starting play so games don't always
             #  start with a corner play.
             if turn_number == 0:
                 self.play_random(turn_number, mark)
-
-            # Look for a winning or blocking play.
-            if turn_number == self.turn_number():
-                self.play_rudiments(mark)
-
-            if turn_number == self.turn_number():
-                self.play_defense(turn_number, mark)
-
-            if turn_number == self.turn_number():
-                self.play_corners(turn_number, mark)
-
-            # No preferred play available, so play random.
-            if turn_number == self.turn_number():
-                self.play_random(turn_number, mark)
+            else:
+                # Look for a winning or blocking play, then defend, then
+                #   play corners. No preferred play available, so play random.
+                #   Each play_*() returns True once it has played the turn.
+                for play in self.auto_plays['Autoplay tactics']:
+                    if play(turn_number, mark):
+                        break
 
             self.auto_repeat(mark, self.autoplay_tactics)
 
@@ -1381,7 +1511,7 @@ class TicTacToeGUI(tk.Tk):
             self.check_winner(mark)
 
         # Need to the advance the mark for next turn.
-        self.auto_marks = self.auto_marks.lstrip(mark)
+        self.auto_mark_idx += 1
 
         # Need a pause so user can see what play was made and also
         #   allow auto_stop() to break the call cycle.
@@ -1404,25 +1534,26 @@ class TicTacToeGUI(tk.Tk):
         :param mark: The winning player's mark, usually 'X' or 'O'.
                      For tie games call with 'TIE'.
         """
-        _x, _y, _z = combo
+        # The flashed squares are looked up once, for both callbacks.
+        #   Each flash recolors its squares, then redraws them all at once.
+        squares = [self.board_labels[idx] for idx in combo]
 
         def flash_show():
-            self.board_labels[_x].config(text=mark, bg=COLOR['sq_won'])
-            self.board_labels[_y].config(text=mark, bg=COLOR['sq_won'])
-            self.board_labels[_z].config(text=mark, bg=COLOR['sq_won'])
+            for lbl in squares:
+                lbl.config(text=mark, bg=self.sq_won_color)
             self.update_idletasks()
 
         def flash_erase():
-            self.board_labels[_x].config(text=' ', bg=COLOR['sq_not_won'])
-            self.board_labels[_y].config(text=' ', bg=COLOR['sq_not_won'])
-            self.board_labels[_z].config(text=' ', bg=COLOR['sq_not_won'])
+            for lbl in squares:
+                lbl.config(text=' ', bg=self.sq_not_won_color)
+            self.update_idletasks()
 
         # On a tie game, flash the board, then 'TIE' in center square.
         #   Flashing the board assures display of the last played *mark*.
         if mark == 'TIE':
             for lbl in self.board_labels:
-                lbl.config(bg=COLOR['sq_won'])
-                self.update_idletasks()
+                lbl.config(bg=self.sq_won_color)
+            self.update_idletasks()
             self.after(self.autospeed_control('fast'))
 
         # after() time of 1ms is needed for the flash to work.
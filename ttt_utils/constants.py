@@ -2,12 +2,20 @@
 Constants and configuration settings.
 MY_OS: the first 3 letters of current system platform.
 PLAYER1, PLAYER2: the displayed player names.
+PLAYER_MODES, AUTO_MODES: sets of the mode_clicked Radiobutton values.
 P1_MARK, P2_MARK: 'X', 'O', respectively, but can be changed.
-MARKS1, MARKS2: strings of duplicate marks that determine number of auto turns.
+AUTO_MARKS: string of alternating marks that determines number of auto turns.
 WINNING_COMBOS, CORNERS, SIDES, PARA_CORNERS, ORTHO_SIDES, META_POSITIONS:
-    lists of game board indices.
+    tuples, or dictionaries of tuples, of game board indices.
+FULL_BOARD, WIN_MASKS, CORNERS_MASK, SIDES_MASK: 9-bit bitboard masks
+    of game board indices.
+ORTHO_SIDES_BITS, META_POSITIONS_BITS, PARA_CORNERS_BITS: the defensive
+    positions, keyed by (or as) opponent bitboards.
+LINES_THROUGH: per board index, bitboard masks of the other two indices
+    of each winning line through it.
 KP2PLAY, KEYS2PLAY: strings of ordered keys for bind() functions.
 PLAY_AFTER, AUTO_FAST, AUTO_SLOW: ms integers for tk after() function.
+BOARD: platform-specific padding and border sizes of game board squares.
 TIES, WINS: (unused) tuples of board end-game configurations, in index order.
 """
 # Copyright (C) 2022 C.S. Echt under MIT License'
@@ -20,13 +28,16 @@ MY_OS = platform[:3]
 PLAYER1 = 'Player 1'
 PLAYER2 = 'Player 2'
 
+# Values of the play mode Radiobuttons, grouped for membership tests.
+PLAYER_MODES = frozenset({'pvp', 'pvpc'})
+AUTO_MODES = frozenset({'Autoplay random', 'Autoplay center', 'Autoplay tactics'})
+
 # Can use any utf-8 character for play marks.
 P1_MARK = 'X'
 P2_MARK = 'O'
 
-# Set number of auto-player turns; used in auto_turns_limit().
-MARKS1 = P1_MARK * 500
-MARKS2 = P2_MARK * 500
+# Set number of auto-player turns; used in auto_start().
+AUTO_MARKS = (P1_MARK + P2_MARK) * 500
 
 # Keys in positional 3x3 layout on keypad and main board correspond
 #   with the 3x3 game board row-column layout and sorted
@@ -35,34 +46,55 @@ KP2PLAY = '789456123'
 KEYS2PLAY = 'qweasdzxc'
 
 # 3x3 game board indices for winning combinations and corners.
-WINNING_COMBOS = [
+WINNING_COMBOS = (
     (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
     (0, 3, 6), (1, 4, 7), (2, 5, 8),  # columns
     (0, 4, 8), (2, 4, 6),  # diagonals
-]
+)
+
+# Bitboards set bit i for a mark at board index i; a player has won when
+#   all bits of any WIN_MASKS mask are set. Masks are in WINNING_COMBOS order.
+FULL_BOARD = 0b111111111
+WIN_MASKS = tuple(sum(1 << i for i in combo) for combo in WINNING_COMBOS)
+
+# An empty square wins (or must be blocked) when a player holds both
+#   other squares of any of the 2 to 4 winning lines through it.
+LINES_THROUGH = tuple(
+    tuple(mask & ~(1 << idx) for mask in WIN_MASKS if mask & (1 << idx))
+    for idx in range(9))
 
-CORNERS = [0, 2, 6, 8]
-SIDES = [1, 3, 5, 7]
-# ORTHO_CORNERS = ([0, 2], [0, 6], [2, 8], [6, 8])
-PARA_CORNERS = ([0, 8], [2, 6])
+CORNERS = (0, 2, 6, 8)
+CORNERS_MASK = sum(1 << i for i in CORNERS)
+SIDES = (1, 3, 5, 7)
+SIDES_MASK = sum(1 << i for i in SIDES)
+# ORTHO_CORNERS = ((0, 2), (0, 6), (2, 8), (6, 8))
+PARA_CORNERS = ((0, 8), (2, 6))
 
 # Dictionaries where key is index to be played in response to value for
 #   an opponent's played indices.
 # Keys are orthogonal (nearest) corner indices to opponent's played indices.
 ORTHO_SIDES = {
-    0: [1, 3],
-    2: [1, 5],
-    6: [3, 7],
-    8: [5, 7]
+    0: (1, 3),
+    2: (1, 5),
+    6: (3, 7),
+    8: (5, 7)
 }
 
 META_POSITIONS = {
-    0: [2, 3],
-    2: [0, 5],
-    6: [3, 8],
-    8: [5, 6]
+    0: (2, 3),
+    2: (0, 5),
+    6: (3, 8),
+    8: (5, 6)
 }
 
+# The same defensive positions keyed by the opponent's bitboard, so that
+#   a position is matched with one lookup of the opponent's bits.
+ORTHO_SIDES_BITS = {sum(1 << i for i in val): key
+                    for key, val in ORTHO_SIDES.items()}
+META_POSITIONS_BITS = {sum(1 << i for i in val): key
+                       for key, val in META_POSITIONS.items()}
+PARA_CORNERS_BITS = frozenset(sum(1 << i for i in val) for val in PARA_CORNERS)
+
 # Milliseconds, used in after() calls.
 PLAY_AFTER = 600  # PC response time for PvPC mode.
 AUTO_FAST = 100  # Fast cycle time for all autoplay modes.
@@ -84,6 +116,20 @@ COLOR = {
     'button_bg': 'DodgerBlue1',
 }
 
+# Platform-specific game board square padding and borders, in pixels.
+#  The padding sub-keys are grid() args; the others are Label options.
+#  Windows settings are used if the operating system is not 'dar' (macOS)
+#  or 'lin' (Linux).
+BOARD_SETTINGS = {
+    'win': {'pad': 8, 'ipadx': 10, 'ipady': 6,
+            'borderwidth': 2, 'highlightthickness': 5},
+    'lin': {'pad': 0, 'ipadx': 10, 'ipady': 6,
+            'borderwidth': 2, 'highlightthickness': 5},
+    'dar': {'pad': 6, 'ipadx': 0, 'ipady': 0,
+            'borderwidth': 6, 'highlightthickness': 0},
+}
+BOARD = BOARD_SETTINGS.get(MY_OS, BOARD_SETTINGS['win'])
+
 # These font statements ensure that the GUI has a consistent look and feel
 #  across different operating systems. Default system fonts are used and
 #  sizes and weights adjusted as needed for proper spacing.
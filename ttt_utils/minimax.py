@@ -0,0 +1,112 @@
+"""
+A precomputed minimax solution of the Tic Tac Toe game tree.
+OPTIMAL_MOVES: maps every reachable, undecided board state to its best
+    board_labels indices to play.
+bit_indices: the board_labels indices of a bitboard's set bits.
+state_key: the OPTIMAL_MOVES key of a board state.
+Board states are keyed by state_key(mover_bits, opponent_bits), where
+each bitboard has bit i set when the player has a mark at board_labels
+index i. Keys are from the perspective of the player whose turn it is,
+so the table serves whichever player, X or O, is to move.
+"""
+# Copyright (C) 2022 C.S. Echt under MIT License'
+
+from types import MappingProxyType
+
+from ttt_utils.constants import FULL_BOARD, WIN_MASKS
+
+
+def bit_indices(bits: int) -> tuple:
+    """
+    Decode a bitboard into the board_labels indices of its set bits.
+
+    :param bits: A bitboard integer, e.g., one of WIN_MASKS.
+    :return: Tuple of indices, in ascending order.
+    """
+    indices = []
+    while bits:
+        # bits & -bits isolates the lowest set bit.
+        indices.append((bits & -bits).bit_length() - 1)
+        bits &= bits - 1
+    return tuple(indices)
+
+
+def state_key(mover: int, opponent: int) -> int:
+    """
+    Pack the two 9-bit bitboards of a board state into one integer,
+    which hashes and compares faster than a tuple key.
+
+    :param mover: Bitboard of the player to move.
+    :param opponent: Bitboard of the player that just moved.
+    :return: The 18-bit OPTIMAL_MOVES key, as integer.
+    """
+    return mover << 9 | opponent
+
+
+def _score(mover: int, opponent: int, scores: dict) -> int:
+    """
+    Negamax score of a board for the player to move, memoized in *scores*.
+    Wins score higher the fewer turns they take, losses score lower the
+    sooner they happen, and ties score 0.
+
+    :param mover: Bitboard of the player to move.
+    :param opponent: Bitboard of the player that just moved.
+    :param scores: Dictionary of scores already solved, keyed as
+                   (mover, opponent).
+    :return: The score, as integer, with best play by both players.
+    """
+    key = (mover, opponent)
+    if key in scores:
+        return scores[key]
+
+    empty = FULL_BOARD & ~(mover | opponent)
+    if any((opponent & mask) == mask for mask in WIN_MASKS):
+        score = -(1 + bin(empty).count('1'))
+    elif not empty:
+        score = 0
+    else:
+        # Try each empty square by peeling off the lowest set bit.
+        score = -10
+        while empty:
+            move = empty & -empty
+            empty ^= move
+            score = max(score, -_score(opponent, mover | move, scores))
+
+    scores[key] = score
+    return score
+
+
+def _solve() -> dict:
+    """
+    Search the game tree from the empty board and record, for each
+    undecided board state, all moves that have the best score.
+
+    :return: Dictionary of state_key(mover_bits, opponent_bits):
+             tuple of indices.
+    """
+    scores = {}
+    moves = {}
+    pending = [(0, 0)]
+    while pending:
+        mover, opponent = pending.pop()
+        key = state_key(mover, opponent)
+        if key in moves:
+            continue
+
+        empty = FULL_BOARD & ~(mover | opponent)
+        if not empty or any((opponent & mask) == mask for mask in WIN_MASKS):
+            continue
+
+        move_scores = {i: -_score(opponent, mover | (1 << i), scores)
+                       for i in bit_indices(empty)}
+        best = max(move_scores.values())
+        moves[key] = tuple(
+            i for i, score in move_scores.items() if score == best)
+
+        pending.extend((opponent, mover | (1 << i)) for i in move_scores)
+
+    return moves
+
+
+# Solved once, at import; read-only thereafter.
+OPTIMAL_MOVES = MappingProxyType(_solve())
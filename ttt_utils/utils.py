@@ -62,7 +62,7 @@ def handle_exception(exc_type, exc_value, exc_traceback) -> None:
 
 
 def check_platform():
-    if MY_OS not in 'lin, win, dar':
+    if MY_OS not in ('lin', 'win', 'dar'):
         print(f'Platform <{sys.platform}> is not supported.\n'
               'Windows, Linux, and MacOS (darwin) are supported.')
         sys.exit(1)